@@ -1,8 +1,64 @@
 #!/usr/bin/env python3
+import os
 import sys
+import array
+import tempfile
 import subprocess
-import json
 import argparse # Standard library for command-line parsing
+from concurrent.futures import ProcessPoolExecutor
+
+# numpy reduces the collected int64 durations with a SIMD sum instead of
+# Python-int additions. Optional; sum() is used when it is not installed.
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+# Lines are parsed in chunks of this size so the work can be spread across
+# worker processes on large playlists.
+PARSE_CHUNK_SIZE = 1000
+# Below this many videos a process pool costs more to start than it saves.
+PARALLEL_THRESHOLD = 2000
+
+def _sum_durations(durations):
+    """Reduces an int64 duration array, vectorized when numpy is present."""
+    if numpy is not None and len(durations):
+        return int(numpy.frombuffer(durations, dtype=numpy.int64).sum())
+    return sum(durations)
+
+def _parse_video_lines(lines, min_duration_seconds):
+    """
+    Parses a chunk of tab-separated 'duration<TAB>url<TAB>title' lines
+    and aggregates the results.
+    Runs either inline or in a worker process, so it only returns data.
+    Included durations are collected into a packed int64 array so the
+    final reduction can be vectorized; the count is its length.
+    Returns (durations, links, skipped_titles, parse_errors).
+    """
+    durations = array.array('q')
+    links = []
+    skipped_titles = [] # Videos with no duration info, reported by the caller
+    parse_errors = 0
+    for line in lines:
+        try:
+            duration_field, video_url, title = line.rstrip(b'\n').split(b'\t', 2)
+            if duration_field == b'NA':
+                skipped_titles.append(title.decode('utf-8', errors='replace'))
+                continue
+            # yt-dlp reports fractional durations as floats (e.g. '341.5').
+            duration = int(float(duration_field))
+        except ValueError:
+            parse_errors += 1
+            continue
+
+        # The core filtering logic
+        if duration >= min_duration_seconds:
+            durations.append(duration)
+            # Add the video's URL to our list for saving; a missing field
+            # is rendered by --print as the literal 'NA'.
+            if video_url and video_url != b'NA':
+                links.append(video_url.decode('utf-8'))
+    return durations, links, skipped_titles, parse_errors
 
 def get_playlist_duration_ytdlp(playlist_url, min_duration_minutes=0, save_file=None):
     """
@@ -17,52 +73,91 @@ def get_playlist_duration_ytdlp(playlist_url, min_duration_minutes=0, save_file=
                                    will be saved. Defaults to None.
     """
     min_duration_seconds = min_duration_minutes * 60
-    command = ['yt-dlp', '--flat-playlist', '-j', playlist_url]
+    # Only ask yt-dlp for the three fields we actually read. Splitting the
+    # tab-separated output is far cheaper than parsing the full JSON record
+    # '-j' would emit per video, and it shrinks the bytes read ~10x.
+    command = ['yt-dlp', '--flat-playlist', '--print', '%(duration)s\t%(webpage_url)s\t%(title)s', playlist_url]
 
     print("Fetching video list from playlist...")
     if min_duration_seconds > 0:
         print(f"Filter active: Only including videos longer than {min_duration_minutes} minute(s).")
     
+    # Stderr goes to a temp file rather than a pipe: a pipe is only drained
+    # after the stdout loop, so enough warning output from yt-dlp would fill
+    # its ~64 KB capacity and deadlock both processes.
+    stderr_spool = tempfile.TemporaryFile()
     try:
-        result = subprocess.run(command, capture_output=True, text=True, check=True, encoding='utf-8')
+        # Stream yt-dlp's output through a pipe instead of buffering it all:
+        # parsing overlaps with the network fetch and peak memory stays flat
+        # regardless of playlist size. Stdout stays as bytes; only the few
+        # fields we keep ever get decoded.
+        proc = subprocess.Popen(command, stdout=subprocess.PIPE, stderr=stderr_spool, bufsize=1 << 20)
     except FileNotFoundError:
+        stderr_spool.close()
         print("Error: 'yt-dlp' command not found.")
         print("Please ensure yt-dlp is installed and in your system's PATH.")
         return None
-    except subprocess.CalledProcessError as e:
-        print(f"Error running yt-dlp. It might be a private/invalid playlist.\nDetails: {e.stderr}")
-        return None
-    
+
     total_seconds = 0
     total_videos_found = 0
     included_videos_count = 0
     included_video_links = [] # List to store links that meet the criteria
-    
-    video_lines = result.stdout.strip().split('\n')
-    total_videos_found = len(video_lines)
 
-    print(f"\nFound {total_videos_found} videos. Processing...")
-    
-    for line in video_lines:
-        try:
-            video_meta = json.loads(line)
-            duration = video_meta.get('duration')
-
-            if duration is not None:
-                # The core filtering logic
-                if duration >= min_duration_seconds:
-                    total_seconds += duration
-                    included_videos_count += 1
-                    # Add the video's URL to our list for saving
-                    video_url = video_meta.get('webpage_url')
-                    if video_url:
-                        included_video_links.append(video_url)
-            else:
-                print(f"Warning: Skipping video with no duration info: {video_meta.get('title', 'N/A')}")
-        except (json.JSONDecodeError, KeyError):
-            print("Warning: Could not parse metadata for one entry.")
+    print("\nProcessing videos as they arrive...")
+
+    # Chunks are submitted to a process pool once the playlist proves large
+    # enough; until then they queue up and fall back to inline parsing.
+    executor = None
+    futures = []
+    ready_chunks = []
+    chunk = []
+
+    for line in proc.stdout:
+        if line == b'\n':
             continue
-    
+        total_videos_found += 1
+        chunk.append(line)
+        if len(chunk) == PARSE_CHUNK_SIZE:
+            ready_chunks.append(chunk)
+            chunk = []
+            if executor is None and total_videos_found >= PARALLEL_THRESHOLD:
+                executor = ProcessPoolExecutor(max_workers=os.cpu_count())
+            if executor is not None:
+                for queued in ready_chunks:
+                    futures.append(executor.submit(_parse_video_lines, queued, min_duration_seconds))
+                ready_chunks = []
+
+    if chunk:
+        ready_chunks.append(chunk)
+
+    # Stdout is exhausted; reap the process and read back the spooled stderr.
+    proc.wait()
+    stderr_spool.seek(0)
+    stderr_output = stderr_spool.read()
+    stderr_spool.close()
+    if proc.returncode != 0:
+        if executor is not None:
+            executor.shutdown(cancel_futures=True)
+        print(f"Error running yt-dlp. It might be a private/invalid playlist.\nDetails: {stderr_output.decode('utf-8', errors='replace')}")
+        return None
+
+    if executor is not None:
+        for queued in ready_chunks:
+            futures.append(executor.submit(_parse_video_lines, queued, min_duration_seconds))
+        chunk_results = [future.result() for future in futures]
+        executor.shutdown()
+    else:
+        chunk_results = [_parse_video_lines(queued, min_duration_seconds) for queued in ready_chunks]
+
+    for durations, links, skipped_titles, parse_errors in chunk_results:
+        total_seconds += _sum_durations(durations)
+        included_videos_count += len(durations)
+        included_video_links.extend(links)
+        for title in skipped_titles:
+            print(f"Warning: Skipping video with no duration info: {title}")
+        for _ in range(parse_errors):
+            print("Warning: Could not parse metadata for one entry.")
+
     summary = f"\nProcessed {total_videos_found} videos."
     if min_duration_seconds > 0:
         summary += f" Included {included_videos_count} videos longer than {min_duration_minutes} minute(s)."
@@ -75,8 +170,9 @@ def get_playlist_duration_ytdlp(playlist_url, min_duration_minutes=0, save_file=
         print(f"\nSaving {len(included_video_links)} video links to '{save_file}'...")
         try:
             with open(save_file, 'w', encoding='utf-8') as f:
-                for link in included_video_links:
-                    f.write(link + '\n')
+                # One join and one write instead of a concat + write per link.
+                f.write('\n'.join(included_video_links))
+                f.write('\n')
             print("File saved successfully.")
         except IOError as e:
             print(f"Error: Could not write to file '{save_file}'. Reason: {e}")